@@ -0,0 +1,47 @@
+export const dynamic = 'force-dynamic'
+
+import { NextRequest, NextResponse } from 'next/server'
+import { POST as performAction } from '../route'
+
+const MAX_BATCH_SIZE = 10
+
+export async function POST(request: NextRequest) {
+  try {
+    const { gameId, userId, actions } = await request.json()
+
+    // Validate required fields
+    if (!gameId || !userId || !Array.isArray(actions) || actions.length === 0) {
+      return NextResponse.json({ error: 'Missing required fields: gameId, userId, actions' }, { status: 400 })
+    }
+
+    if (actions.length > MAX_BATCH_SIZE) {
+      return NextResponse.json({ error: `Too many actions in one batch (max ${MAX_BATCH_SIZE})` }, { status: 400 })
+    }
+
+    // Replay each action through the single-action handler so a batch
+    // behaves exactly like N sequential POSTs, minus the per-request
+    // HTTP and JSON overhead. Results keep the submitted order.
+    const authHeader = request.headers.get('authorization')
+    const results = []
+    for (const action of actions) {
+      const subRequest = new NextRequest(new URL('/api/game/action', request.url), {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+          ...(authHeader ? { authorization: authHeader } : {})
+        },
+        body: JSON.stringify({ gameId, userId, action })
+      })
+      const response = await performAction(subRequest)
+      results.push({ action, status: response.status, body: await response.json() })
+    }
+
+    return NextResponse.json({ success: true, results })
+  } catch (error) {
+    console.error('Batch action error:', error)
+    return NextResponse.json(
+      { error: 'Internal server error' },
+      { status: 500 }
+    )
+  }
+}
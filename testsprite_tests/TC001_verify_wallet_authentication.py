@@ -0,0 +1,22 @@
+from _http import dump_json, request_json
+from _schemas import validate
+from _urls import JSON_HEADERS, URL_AUTH_WALLET
+
+
+async def test_verify_wallet_authentication(http_session):
+    """Verify POST /api/auth/wallet authenticates a known mock wallet and rejects malformed addresses."""
+    # Authenticate with one of the documented mock wallets
+    payload = {"walletAddress": "0x1234567890123456789012345678901234567890"}
+    status, data = await request_json(
+        http_session, "POST", URL_AUTH_WALLET, data=dump_json(payload), headers=JSON_HEADERS
+    )
+    assert status == 200, f"Expected 200 OK, got {status}: {data}"
+    validate("wallet_auth", data)
+    assert data["user"]["walletAddress"] == payload["walletAddress"].lower(), "Returned wallet address should be normalized to lowercase"
+
+    # A malformed wallet address must be rejected with 400
+    bad_status, bad_data = await request_json(
+        http_session, "POST", URL_AUTH_WALLET, data=dump_json({"walletAddress": "not-a-wallet"}), headers=JSON_HEADERS
+    )
+    assert bad_status == 400, f"Expected 400 for malformed address, got {bad_status}"
+    assert "error" in bad_data, "Error response should contain an error message"
@@ -0,0 +1,11 @@
+from _http import request_json
+from _schemas import validate
+from _urls import URL_USER
+
+
+async def test_get_current_user_profile(http_session):
+    """Verify GET /api/user returns (or lazily creates) the demo user with its profile fields."""
+    status, data = await request_json(http_session, "GET", URL_USER)
+    assert status == 200, f"Expected 200 OK, got {status}: {data}"
+
+    validate("user_profile", data)
@@ -0,0 +1,23 @@
+import pytest
+
+# Tests that mutate the shared server-side user (balance, username, game
+# settlements) must stay on one worker under --dist=loadgroup, or their
+# writes race each other's verification reads.
+pytestmark = pytest.mark.xdist_group(name="shared-user-state")
+
+
+async def test_start_blackjack_game_with_valid_bet(bootstrapped_user, started_game):
+    """Verify POST /api/game/play deals a new blackjack game when the user places a valid bet."""
+    user_id = bootstrapped_user["id"]
+    data = started_game
+
+    assert data.get("success") is True, f"Expected success=True in response, got {data}"
+    assert isinstance(data.get("game"), dict), "Response should contain a game object"
+
+    game = data["game"]
+    assert "id" in game and isinstance(game["id"], str), "Game object should contain a string id"
+    assert game.get("playerId") == user_id, "Game should belong to the requesting user"
+    assert game.get("betAmount") == 50, f"Expected betAmount=50, got {game.get('betAmount')}"
+    assert game.get("state") in ("PLAYING", "ENDED", "INSURANCE"), f"Unexpected game state after deal: {game.get('state')}"
+    assert isinstance(game.get("playerHand"), dict), "Game object should contain the player hand"
+    assert len(game["playerHand"].get("cards", [])) == 2, "Player should be dealt exactly two cards"
@@ -0,0 +1,63 @@
+import pytest
+
+from _http import dump_json, request_json
+from _urls import JSON_HEADERS, URL_GAME_ACTION, URL_GAME_ACTION_BATCH
+
+# Settling actions changes the shared user's balance; keep this on the
+# same worker as the other state-mutating tests under --dist=loadgroup
+pytestmark = pytest.mark.xdist_group(name="shared-user-state")
+
+
+async def post_action_batch(session, game_id, user_id, actions):
+    """POST the whole action list to /api/game/action/batch, returning (status, data)."""
+    return await request_json(
+        session,
+        "POST",
+        URL_GAME_ACTION_BATCH,
+        data=dump_json({"gameId": game_id, "userId": user_id, "actions": list(actions)}),
+        headers=JSON_HEADERS,
+    )
+
+
+async def test_perform_blackjack_game_action(http_session, bootstrapped_user, started_game):
+    """Verify the game action API accepts every documented action on a freshly dealt game."""
+    user_id = bootstrapped_user["id"]
+
+    # Act on the game the session fixture already dealt for TC003, saving
+    # a second POST to /api/game/play per worker
+    game_id = started_game["game"]["id"]
+
+    # Exercise every documented action through the batch endpoint, which
+    # amortizes the six round trips into one POST. Some actions are
+    # invalid for the current game state (e.g. insurance without a dealer
+    # ace), which the API reports per entry as 400 -- both outcomes are
+    # acceptable here.
+    actions = ["hit", "stand", "double_down", "insurance", "surrender", "set_ace_value"]
+    status, batch_data = await post_action_batch(http_session, game_id, user_id, actions)
+    if status == 404:
+        pytest.skip("batch action endpoint not available on this server")
+    assert status == 200, f"Expected 200 OK from batch endpoint, got {status}: {batch_data}"
+    assert batch_data.get("success") is True, f"Expected success=True from batch endpoint, got {batch_data}"
+
+    results = batch_data.get("results")
+    assert isinstance(results, list) and len(results) == len(actions), "Batch should return one ordered result per action"
+    for action, result in zip(actions, results):
+        assert result.get("action") == action, f"Batch results out of order: expected '{action}', got {result.get('action')}"
+        assert result.get("status") in (200, 400), (
+            f"Action '{action}' returned unexpected status {result.get('status')}: {result.get('body')}"
+        )
+        body = result.get("body") or {}
+        if result["status"] == 200:
+            assert isinstance(body.get("game"), dict), f"Successful action '{action}' should return the updated game"
+        else:
+            assert "error" in body, f"Rejected action '{action}' should return an error message"
+
+    # An undocumented action must always be rejected
+    invalid_status, _ = await request_json(
+        http_session,
+        "POST",
+        URL_GAME_ACTION,
+        data=dump_json({"gameId": game_id, "userId": user_id, "action": "split"}),
+        headers=JSON_HEADERS,
+    )
+    assert invalid_status == 400, f"Expected 400 for invalid action, got {invalid_status}"
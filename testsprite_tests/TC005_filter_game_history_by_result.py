@@ -0,0 +1,35 @@
+import asyncio
+
+from _http import read_json
+from _urls import URL_HISTORY
+
+
+async def test_filter_game_history_by_result(http_session, bootstrapped_user):
+    """Verify GET /api/history honors the resultFilter query parameter for every filter value."""
+    user_id = bootstrapped_user["id"]
+
+    async def fetch_history(result_filter):
+        async with http_session.get(
+            URL_HISTORY,
+            params={"userId": user_id, "page": 1, "limit": 20, "resultFilter": result_filter},
+        ) as response:
+            assert response.status == 200, f"Expected 200 OK for filter '{result_filter}', got {response.status}"
+            return await read_json(response)
+
+    # The filter queries are read-only and independent of each other, so
+    # gather them on the shared session and they cost one round trip.
+    result_filters = ["all", "win", "lose", "push", "blackjack"]
+    all_data = await asyncio.gather(*(fetch_history(f) for f in result_filters))
+
+    for result_filter, data in zip(result_filters, all_data):
+        assert isinstance(data.get("games"), list), f"Filter '{result_filter}' should return a games list"
+        assert isinstance(data.get("overallStats"), dict), f"Filter '{result_filter}' should return overall stats"
+        assert isinstance(data.get("pagination"), dict), f"Filter '{result_filter}' should return pagination info"
+        assert data["pagination"].get("limit") == 20, f"Pagination limit should echo the requested 20 for '{result_filter}'"
+
+        # Every returned game must match the requested filter
+        if result_filter != "all":
+            for game in data["games"]:
+                assert game.get("result") == result_filter.upper(), (
+                    f"Filter '{result_filter}' returned game with result {game.get('result')}"
+                )
@@ -0,0 +1,46 @@
+import pytest
+
+from _http import dump_json, request_json
+from _urls import JSON_HEADERS, URL_USER_UPDATE
+
+# Mutates the shared user's profile; keep on the same worker as the
+# other state-mutating tests under --dist=loadgroup
+pytestmark = pytest.mark.xdist_group(name="shared-user-state")
+
+
+async def test_update_user_profile(http_session, bootstrapped_user):
+    """Verify PUT /api/user/update changes the username and validates its length."""
+    user_id = bootstrapped_user["id"]
+    original_username = bootstrapped_user.get("username")
+
+    new_username = "TestSprite Player"
+    status, data = await request_json(
+        http_session,
+        "PUT",
+        URL_USER_UPDATE,
+        data=dump_json({"userId": user_id, "username": new_username}),
+        headers=JSON_HEADERS,
+    )
+    assert status == 200, f"Expected 200 OK updating username, got {status}: {data}"
+    assert data.get("success") is True, f"Expected success=True in response, got {data}"
+    assert data.get("user", {}).get("username") == new_username, "Response should echo the updated username"
+
+    # A single-character username must be rejected with 400
+    bad_status, _ = await request_json(
+        http_session,
+        "PUT",
+        URL_USER_UPDATE,
+        data=dump_json({"userId": user_id, "username": "x"}),
+        headers=JSON_HEADERS,
+    )
+    assert bad_status == 400, f"Expected 400 for too-short username, got {bad_status}"
+
+    # Restore the original username so other tests see the expected profile
+    if original_username:
+        await request_json(
+            http_session,
+            "PUT",
+            URL_USER_UPDATE,
+            data=dump_json({"userId": user_id, "username": original_username}),
+            headers=JSON_HEADERS,
+        )
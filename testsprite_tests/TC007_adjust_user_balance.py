@@ -0,0 +1,43 @@
+import pytest
+
+from _http import cached_get, dump_json, request_json
+from _urls import JSON_HEADERS, URL_USER, user_url
+
+# Mutates the shared user's balance and asserts the exact value on
+# re-read; keep on the same worker as the other state-mutating tests
+# under --dist=loadgroup
+pytestmark = pytest.mark.xdist_group(name="shared-user-state")
+
+
+async def test_adjust_user_balance(http_session, bootstrapped_user):
+    """Verify POST /api/user adjusts the demo user's balance and GET /api/user/{id} reflects it."""
+    user_id = bootstrapped_user["id"]
+
+    # Read the balance through the per-user endpoint before adjusting;
+    # this pre-work read is safe to share with other lookups of the user
+    before_data = await cached_get(http_session, user_url(user_id))
+    before_user = before_data.get("user")
+    assert isinstance(before_user, dict), "Per-user response should contain a user object"
+    assert isinstance(before_user.get("balance"), (int, float)), "User object should contain a numeric balance"
+
+    # Adjust the balance to a known value; transient failures are retried
+    # by request_json instead of aborting the test
+    new_balance = 2500
+    status, data = await request_json(
+        http_session,
+        "POST",
+        URL_USER,
+        data=dump_json({"balance": new_balance}),
+        headers=JSON_HEADERS,
+    )
+    assert status == 200, f"Expected 200 OK adjusting balance, got {status}: {data}"
+    assert data.get("user", {}).get("balance") == new_balance, "Adjustment response should echo the new balance"
+
+    # The per-user endpoint must reflect the adjustment -- bypass
+    # cached_get so this re-read observes fresh server state
+    after_status, after_data = await request_json(http_session, "GET", user_url(user_id))
+    assert after_status == 200, f"Expected 200 OK re-fetching user by id, got {after_status}"
+    after_user = after_data.get("user")
+    assert after_user.get("balance") == new_balance, (
+        f"Expected balance {new_balance} after adjustment, got {after_user.get('balance')}"
+    )
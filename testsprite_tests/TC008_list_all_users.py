@@ -0,0 +1,21 @@
+from _http import read_json
+from _urls import URL_USERS
+
+
+async def test_list_all_users(http_session):
+    """Verify GET /api/users returns the user list with per-user activity counts."""
+    async with http_session.get(URL_USERS) as response:
+        assert response.status == 200, f"Expected 200 OK, got {response.status}"
+        data = await read_json(response)
+
+    assert data.get("success") is True, f"Expected success=True in response, got {data}"
+    assert isinstance(data.get("users"), list), "Response should contain a users list"
+    assert len(data["users"]) <= 100, "User list should be capped at 100 entries"
+
+    for user in data["users"]:
+        assert "id" in user and isinstance(user["id"], str), "Each user should contain a string id"
+        assert isinstance(user.get("balance"), (int, float)), "Each user should contain a numeric balance"
+        counts = user.get("_count")
+        assert isinstance(counts, dict), "Each user should contain activity counts"
+        for key in ("games", "sessions", "transactions"):
+            assert isinstance(counts.get(key), int), f"Activity count '{key}' should be an integer"
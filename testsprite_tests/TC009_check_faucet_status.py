@@ -0,0 +1,21 @@
+from _http import cached_get, request_json
+from _urls import URL_FAUCET_STATUS
+
+
+async def test_check_faucet_status(http_session, bootstrapped_user):
+    """Verify GET /api/faucet/status reports claim eligibility for a wallet address."""
+    # Prefer the bootstrapped user's wallet address when it is a real 0x address
+    wallet_address = bootstrapped_user.get("walletAddress") or ""
+    if not wallet_address.startswith("0x") or len(wallet_address) != 42:
+        wallet_address = "0x1234567890123456789012345678901234567890"
+
+    # The status lookup is read-only, so the memoized GET can serve it
+    data = await cached_get(http_session, URL_FAUCET_STATUS, params_key=(("playerAddress", wallet_address),))
+    assert data.get("playerAddress") == wallet_address, "Response should echo the queried address"
+    assert isinstance(data.get("canClaim"), bool), "Response should contain a boolean canClaim flag"
+    assert "claimAmount" in data, "Response should contain the claim amount"
+    assert isinstance(data.get("cooldownDays"), int), "Response should contain the cooldown in days"
+
+    # A missing address must be rejected with 400
+    bad_status, _ = await request_json(http_session, "GET", URL_FAUCET_STATUS)
+    assert bad_status == 400, f"Expected 400 without playerAddress, got {bad_status}"
@@ -0,0 +1,14 @@
+from _http import request_json
+from _urls import URL_HEALTH
+
+
+async def test_health_check_endpoint(http_session):
+    """Verify GET /api/health reports the server and database health."""
+    status, data = await request_json(http_session, "GET", URL_HEALTH)
+    assert status in (200, 503), f"Expected 200 or 503, got {status}: {data}"
+
+    assert "status" in data, "Health response should contain a status field"
+    if status == 200:
+        assert data["status"] == "healthy", f"Expected healthy status on 200, got {data['status']}"
+    else:
+        assert data["status"] == "unhealthy", f"Expected unhealthy status on 503, got {data['status']}"
@@ -0,0 +1,119 @@
+"""Shared async HTTP plumbing for the TestSprite API test suite.
+
+The whole suite runs on one asyncio event loop per worker with a single
+aiohttp.ClientSession (the http_session fixture in conftest.py):
+independent requests overlap on one thread, connections come from one
+keep-alive pool (aiohttp sets TCP_NODELAY on its sockets by default),
+and task switches cost microseconds instead of thread context switches.
+"""
+
+import asyncio
+import json
+
+import aiohttp
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+#: Fastest available JSON decoder, for callers that take a loads hook.
+loads = orjson.loads if orjson is not None else json.loads
+
+BASE_URL = "http://localhost:3000"
+
+# (connect, total) timeouts. The server is on localhost, so connect is
+# sub-millisecond when healthy; failing in 2s instead of 30s keeps a
+# crashed backend from wasting half a minute per test.
+FAST_TIMEOUT = (2, 10)
+
+# Bodies at or below this size are buffered and decoded in one go;
+# larger (or unknown-length) bodies are parsed incrementally.
+STREAM_THRESHOLD = 64 * 1024
+
+#: Transient statuses worth retrying instead of failing the test.
+RETRY_STATUSES = (502, 503, 504)
+
+
+def make_session():
+    """Build the shared ClientSession; conftest creates one per worker."""
+    connector = aiohttp.TCPConnector(limit=50, force_close=False, enable_cleanup_closed=True)
+    timeout = aiohttp.ClientTimeout(connect=FAST_TIMEOUT[0], total=FAST_TIMEOUT[1])
+    return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+
+def dump_json(payload):
+    """Encode a request body for a JSON POST/PUT, preferring orjson."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
+
+
+async def request_json(session, method, url, retries=3, backoff=0.1, **kwargs):
+    """Issue a request and return (status, decoded body).
+
+    Transient failures -- connection errors and 502/503/504 responses --
+    are retried with backoff, mirroring what the urllib3 Retry policy did
+    for the old blocking engine, so one localhost hiccup does not throw
+    away a test's setup work. Bodies decode via orjson when available;
+    non-JSON bodies decode to None.
+    """
+    for attempt in range(retries + 1):
+        try:
+            async with session.request(method, url, **kwargs) as response:
+                if response.status in RETRY_STATUSES and attempt < retries:
+                    await asyncio.sleep(backoff * (2 ** attempt))
+                    continue
+                body = await response.read()
+                try:
+                    data = loads(body) if body else None
+                except ValueError:
+                    data = None
+                return response.status, data
+        except aiohttp.ClientError:
+            if attempt >= retries:
+                raise
+            await asyncio.sleep(backoff * (2 ** attempt))
+
+
+async def read_json(response, threshold=STREAM_THRESHOLD):
+    """Parse the body of a response whose payload may be large.
+
+    Small bodies are buffered and decoded in one go. Larger or
+    unknown-length bodies (the history and user listings can grow) are
+    parsed incrementally off the content stream with ijson, so the
+    encoded payload is never fully resident and parsing overlaps the
+    network read. Falls back to buffering when ijson is not installed.
+    """
+    content_length = response.headers.get("Content-Length")
+    if content_length is not None and int(content_length) <= threshold:
+        return loads(await response.read())
+    try:
+        import ijson
+    except ImportError:
+        return loads(await response.read())
+    # use_float keeps streamed numbers type-compatible with the buffered
+    # loads path (ijson otherwise yields Decimal for non-integral numbers)
+    async for document in ijson.items(response.content, "", use_float=True):
+        return document
+    return None
+
+
+_GET_CACHE = {}
+
+
+async def cached_get(session, url, params_key=()):
+    """Memoized JSON GET for read-only lookups that are safe to reuse in a run.
+
+    params_key must be a hashable tuple of (name, value) pairs. Each
+    worker keeps its own cache, so repeated lookups of the same resource
+    cost one round trip per worker. Verification reads that must observe
+    fresh server state (e.g. TC007's post-adjustment check) should go
+    through the session directly to bypass the cache.
+    """
+    key = (url, params_key)
+    if key not in _GET_CACHE:
+        status, data = await request_json(session, "GET", url, params=dict(params_key))
+        assert status == 200, f"Expected 200 OK from {url}, got {status}: {data}"
+        _GET_CACHE[key] = data
+    return _GET_CACHE[key]
@@ -0,0 +1,187 @@
+"""Canned localhost:3000 responses backing the suite's --mock mode.
+
+The payloads mirror the schemas the TC files assert on, so CI can run
+the whole suite in milliseconds without a live dev server. The user
+balance is the only state the tests mutate, so it is tracked in _STATE
+and shared between the GET and POST handlers.
+"""
+
+import json
+import re
+
+from aioresponses import CallbackResult
+
+from _urls import (
+    URL_AUTH_WALLET,
+    URL_FAUCET_STATUS,
+    URL_GAME_ACTION,
+    URL_GAME_ACTION_BATCH,
+    URL_GAME_PLAY,
+    URL_HEALTH,
+    URL_HISTORY,
+    URL_USER,
+    URL_USER_UPDATE,
+    URL_USERS,
+)
+
+MOCK_WALLET = "0x1234567890123456789012345678901234567890"
+VALID_ACTIONS = ("hit", "stand", "double_down", "insurance", "surrender", "set_ace_value")
+
+_STATE = {"balance": 1000.0}
+
+
+def _user():
+    return {
+        "id": "mock-user-1",
+        "walletAddress": MOCK_WALLET,
+        "username": "TestPlayer1",
+        "balance": _STATE["balance"],
+        "createdAt": "2026-01-01T00:00:00.000Z",
+    }
+
+
+def _game(user_id, bet_amount, game_id="mock-game-1"):
+    ten = {"suit": "hearts", "rank": "10", "value": 10}
+    seven = {"suit": "clubs", "rank": "7", "value": 7}
+    return {
+        "id": game_id,
+        "playerId": user_id,
+        "betAmount": bet_amount,
+        "currentBet": bet_amount,
+        "state": "PLAYING",
+        "playerHand": {"cards": [ten, seven], "value": 17, "isBlackjack": False, "isBust": False},
+        "dealerHand": {"cards": [ten], "value": 10, "isBlackjack": False, "isBust": False},
+    }
+
+
+def _payload(kwargs):
+    # The tests send pre-encoded bodies (data=dump_json(...)), so fall
+    # back to decoding the raw bytes when no json kwarg is present
+    payload = kwargs.get("json")
+    if payload is None:
+        raw = kwargs.get("data")
+        payload = json.loads(raw) if raw else {}
+    return payload
+
+
+def register(aio):
+    """Register every endpoint the suite hits onto an aioresponses mock."""
+
+    def wallet_auth(url, **kwargs):
+        address = _payload(kwargs).get("walletAddress") or ""
+        is_valid = (address.startswith("0x") and len(address) == 42) or address.startswith("test_wallet_dummy_")
+        if not is_valid:
+            return CallbackResult(status=400, payload={"error": "Invalid wallet address format"})
+        return CallbackResult(status=200, payload={
+            "success": True,
+            "user": dict(_user(), walletAddress=address.lower()),
+            "stats": {"totalGames": 0, "totalBet": 0, "totalWin": 0, "winRate": 0},
+            "recentGames": [],
+            "isMock": True,
+        })
+
+    def get_user(url, **kwargs):
+        return CallbackResult(status=200, payload={"user": _user()})
+
+    def set_balance(url, **kwargs):
+        payload = _payload(kwargs)
+        _STATE["balance"] = payload.get("balance", _STATE["balance"])
+        return CallbackResult(status=200, payload={"user": _user()})
+
+    def get_user_by_id(url, **kwargs):
+        user = dict(_user(), _count={"games": 1, "sessions": 1, "transactions": 1})
+        return CallbackResult(status=200, payload={"user": user, "transactions": []})
+
+    def update_user(url, **kwargs):
+        payload = _payload(kwargs)
+        username = (payload.get("username") or "").strip()
+        if not payload.get("userId") or not username:
+            return CallbackResult(status=400, payload={"error": "User ID and username are required"})
+        if len(username) < 2 or len(username) > 30:
+            return CallbackResult(status=400, payload={"error": "Username must be between 2 and 30 characters"})
+        return CallbackResult(status=200, payload={"success": True, "user": dict(_user(), username=username)})
+
+    def play(url, **kwargs):
+        payload = _payload(kwargs)
+        if not payload.get("userId") or not payload.get("betAmount") or not payload.get("moveType"):
+            return CallbackResult(status=400, payload={"error": "Missing required fields: userId, betAmount, moveType"})
+        return CallbackResult(status=200, payload={"success": True, "game": _game(payload["userId"], payload["betAmount"])})
+
+    def action(url, **kwargs):
+        payload = _payload(kwargs)
+        if payload.get("action") not in VALID_ACTIONS:
+            return CallbackResult(status=400, payload={"error": "Invalid action. Available: " + ", ".join(VALID_ACTIONS)})
+        game = _game(payload.get("userId"), 25, game_id=payload.get("gameId"))
+        return CallbackResult(status=200, payload={"success": True, "game": game})
+
+    def action_batch(url, **kwargs):
+        payload = _payload(kwargs)
+        actions = payload.get("actions") or []
+        if not payload.get("gameId") or not payload.get("userId") or not actions:
+            return CallbackResult(status=400, payload={"error": "Missing required fields: gameId, userId, actions"})
+        results = []
+        for act in actions:
+            if act in VALID_ACTIONS:
+                game = _game(payload["userId"], 25, game_id=payload["gameId"])
+                results.append({"action": act, "status": 200, "body": {"success": True, "game": game}})
+            else:
+                results.append({"action": act, "status": 400, "body": {"error": "Invalid action. Available: " + ", ".join(VALID_ACTIONS)}})
+        return CallbackResult(status=200, payload={"success": True, "results": results})
+
+    def get_history(url, **kwargs):
+        result_filter = url.query.get("resultFilter", "all")
+        limit = int(url.query.get("limit", "20"))
+        results = ["WIN", "LOSE", "PUSH"] if result_filter == "all" else [result_filter.upper()]
+        games = [
+            {
+                "id": f"mock-history-{i}",
+                "date": "2026-01-01T00:00:00.000Z",
+                "betAmount": 50,
+                "result": result,
+                "winAmount": 0,
+                "netProfit": 0,
+                "playerValue": 17,
+                "dealerValue": 20,
+                "isBlackjack": False,
+                "isBust": False,
+                "sessionId": "mock-session-1",
+            }
+            for i, result in enumerate(results)
+        ]
+        return CallbackResult(status=200, payload={
+            "games": games,
+            "sessions": [],
+            "overallStats": {"totalHands": len(games), "totalBet": 0, "totalWin": 0, "netProfit": 0, "winRate": 0, "blackjacks": 0, "busts": 0},
+            "pagination": {"page": 1, "limit": limit, "total": len(games), "totalPages": 1},
+        })
+
+    def list_users(url, **kwargs):
+        user = dict(_user(), _count={"games": 1, "sessions": 1, "transactions": 1})
+        return CallbackResult(status=200, payload={"success": True, "users": [user]})
+
+    def faucet_status(url, **kwargs):
+        address = url.query.get("playerAddress")
+        if not address:
+            return CallbackResult(status=400, payload={"error": "playerAddress required"})
+        return CallbackResult(status=200, payload={
+            "playerAddress": address,
+            "canClaim": True,
+            "claimAmount": "100",
+            "lastClaimTime": None,
+            "nextClaimTime": None,
+            "cooldownDays": 30,
+            "timestamp": "2026-01-01T00:00:00.000Z",
+        })
+
+    aio.post(URL_AUTH_WALLET, callback=wallet_auth, repeat=True)
+    aio.get(URL_USER, callback=get_user, repeat=True)
+    aio.post(URL_USER, callback=set_balance, repeat=True)
+    aio.get(re.compile(re.escape(URL_USER) + r"/[\w-]+$"), callback=get_user_by_id, repeat=True)
+    aio.put(URL_USER_UPDATE, callback=update_user, repeat=True)
+    aio.post(URL_GAME_PLAY, callback=play, repeat=True)
+    aio.post(URL_GAME_ACTION, callback=action, repeat=True)
+    aio.post(URL_GAME_ACTION_BATCH, callback=action_batch, repeat=True)
+    aio.get(re.compile(re.escape(URL_HISTORY) + r"(\?.*)?$"), callback=get_history, repeat=True)
+    aio.get(URL_USERS, callback=list_users, repeat=True)
+    aio.get(re.compile(re.escape(URL_FAUCET_STATUS) + r"(\?.*)?$"), callback=faucet_status, repeat=True)
+    aio.get(URL_HEALTH, payload={"status": "healthy", "timestamp": "2026-01-01T00:00:00.000Z"}, repeat=True)
@@ -0,0 +1,55 @@
+"""Compiled JSON Schema validators for response shapes shared by the tests.
+
+fastjsonschema compiles each schema into a specialized validator
+function, so repeated validation is a single call instead of a chain of
+interpreted isinstance checks. Compilation happens lazily on first use
+and the result is cached, keeping import time low.
+"""
+
+from functools import lru_cache
+
+_SCHEMA_DEFS = {
+    "wallet_auth": {
+        "type": "object",
+        "required": ["success", "user", "stats"],
+        "properties": {
+            "success": {"const": True},
+            "user": {
+                "type": "object",
+                "required": ["id", "walletAddress", "balance"],
+                "properties": {
+                    "id": {"type": "string"},
+                    "walletAddress": {"type": "string"},
+                    "balance": {"type": "number"},
+                },
+            },
+            "stats": {"type": "object"},
+        },
+    },
+    "user_profile": {
+        "type": "object",
+        "required": ["user"],
+        "properties": {
+            "user": {
+                "type": "object",
+                "required": ["id", "walletAddress", "balance"],
+                "properties": {
+                    "id": {"type": "string"},
+                    "balance": {"type": "number"},
+                },
+            },
+        },
+    },
+}
+
+
+@lru_cache(maxsize=None)
+def _validator(name):
+    import fastjsonschema
+
+    return fastjsonschema.compile(_SCHEMA_DEFS[name])
+
+
+def validate(name, data):
+    """Validate data against the named schema, raising JsonSchemaException on mismatch."""
+    return _validator(name)(data)
@@ -0,0 +1,28 @@
+"""Endpoint constants shared by the TC00* files.
+
+Hoisted to module scope so the hot request loops do not rebuild the same
+f-strings and header dicts on every call. JSON_HEADERS is a read-only
+mapping so no test can mutate it for the others.
+"""
+
+from types import MappingProxyType
+
+from _http import BASE_URL
+
+URL_AUTH_WALLET = f"{BASE_URL}/api/auth/wallet"
+URL_USER = f"{BASE_URL}/api/user"
+URL_USER_UPDATE = f"{BASE_URL}/api/user/update"
+URL_USERS = f"{BASE_URL}/api/users"
+URL_GAME_PLAY = f"{BASE_URL}/api/game/play"
+URL_GAME_ACTION = f"{BASE_URL}/api/game/action"
+URL_GAME_ACTION_BATCH = f"{BASE_URL}/api/game/action/batch"
+URL_HISTORY = f"{BASE_URL}/api/history"
+URL_FAUCET_STATUS = f"{BASE_URL}/api/faucet/status"
+URL_HEALTH = f"{BASE_URL}/api/health"
+
+JSON_HEADERS = MappingProxyType({"Content-Type": "application/json"})
+
+
+def user_url(user_id):
+    """URL of the per-user endpoint, /api/user/{id}."""
+    return f"{URL_USER}/{user_id}"
@@ -0,0 +1,103 @@
+"""Shared fixtures for the TestSprite API test suite."""
+
+import pytest
+
+from _http import dump_json, make_session, request_json
+from _urls import JSON_HEADERS, URL_GAME_PLAY, URL_HEALTH, URL_USER
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--mock",
+        action="store_true",
+        default=False,
+        help="Serve canned JSON for the API instead of hitting the live dev server",
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _mock_api(request):
+    """Install canned responses for every API endpoint when --mock is given."""
+    if not request.config.getoption("--mock"):
+        yield
+        return
+
+    from aioresponses import aioresponses
+
+    import _mock_server
+
+    with aioresponses() as aio:
+        _mock_server.register(aio)
+        yield
+
+
+@pytest.fixture(scope="session")
+async def http_session():
+    """The pooled aiohttp.ClientSession shared by the whole suite."""
+    async with make_session() as session:
+        yield session
+
+
+@pytest.fixture(scope="session", autouse=True)
+async def _prewarm(_mock_api, http_session):
+    """Open a keep-alive socket before the first test runs.
+
+    The health probe pays the TCP setup cost up front, so the first real
+    test sees a warm pool and its latency is one round trip instead of
+    three. Depends on _mock_api so the canned health endpoint is already
+    installed on --mock runs.
+    """
+    try:
+        await request_json(http_session, "GET", URL_HEALTH, retries=0)
+    except Exception:
+        # Warming is best effort; a down server surfaces in the tests themselves.
+        pass
+
+
+@pytest.fixture(scope="session")
+async def bootstrapped_user(http_session):
+    """Fetch the demo user once per worker and make sure it can cover the suite's bets.
+
+    Most tests only need a valid userId plus a funded balance; doing the
+    GET /api/user (and the occasional top-up POST) once per worker saves a
+    round trip per test.
+    """
+    status, data = await request_json(http_session, "GET", URL_USER)
+    assert status == 200, f"Expected 200 OK bootstrapping user, got {status}: {data}"
+    user = data["user"]
+
+    if user.get("balance", 0) < 500:
+        status, data = await request_json(
+            http_session,
+            "POST",
+            URL_USER,
+            data=dump_json({"balance": 1000}),
+            headers=JSON_HEADERS,
+        )
+        assert status == 200, f"Expected 200 OK topping up balance, got {status}"
+        user = data["user"]
+
+    return {
+        "id": user["id"],
+        "balance": user["balance"],
+        "walletAddress": user.get("walletAddress"),
+        "username": user.get("username"),
+    }
+
+
+@pytest.fixture(scope="session")
+async def started_game(bootstrapped_user, http_session):
+    """Deal one blackjack game per worker and share it across the game tests.
+
+    TC003 asserts on the deal response itself and TC004 only needs a live
+    game id to act on, so a single POST to /api/game/play serves both.
+    """
+    status, data = await request_json(
+        http_session,
+        "POST",
+        URL_GAME_PLAY,
+        data=dump_json({"userId": bootstrapped_user["id"], "betAmount": 50, "moveType": "deal"}),
+        headers=JSON_HEADERS,
+    )
+    assert status == 200, f"Expected 200 OK dealing game, got {status}: {data}"
+    return data